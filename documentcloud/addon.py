@@ -5,18 +5,17 @@ It provides some common Add-On functionality.
 
 # Standard Library
 import argparse
-import json
 import os
 import sys
 import time
 
 # Third Party
 import fastjsonschema
-import requests
 import yaml
 
 # Local
 from .client import DocumentCloud
+from .toolbox import json_loads
 
 
 class BaseAddOn:
@@ -51,12 +50,8 @@ class BaseAddOn:
             for k, v in args.items()
             if k in ["base_uri", "auth_uri"] and v is not None
         }
-        username = (
-            args["username"] if args["username"] else os.environ.get("DC_USERNAME")
-        )
-        password = (
-            args["password"] if args["password"] else os.environ.get("DC_PASSWORD")
-        )
+        username = args.get("username") or os.environ.get("DC_USERNAME")
+        password = args.get("password") or os.environ.get("DC_PASSWORD")
         if username and password:
             client_kwargs["username"] = username
             client_kwargs["password"] = password
@@ -105,11 +100,11 @@ class BaseAddOn:
         if args["data"] is None:
             args["data"] = {}
         else:
-            args["data"] = json.loads(args["data"])
+            args["data"] = json_loads(args["data"])
 
         blob = args.pop("json")
         if blob:
-            blob = json.loads(blob)
+            blob = json_loads(blob)
             if "payload" in blob:
                 # merge v2 json blob into the arguments
                 args.update(blob["payload"])
@@ -167,7 +162,7 @@ class AddOn(BaseAddOn):
         resp = self.client.get(
             f"addon_runs/{self.id}/", params={"upload_file": file_name}
         )
-        presigned_url = resp.json()["presigned_url"]
+        presigned_url = json_loads(resp.content)["presigned_url"]
         # we want data to be in binary mode
         if "b" in file.mode:
             # already binary
@@ -176,7 +171,7 @@ class AddOn(BaseAddOn):
             # text file's buffer is in binary mode
             data = file.buffer
         # pylint: disable=W3101
-        response = requests.put(presigned_url, data=data)
+        response = self.client.storage_session.put(presigned_url, data=data)
         response.raise_for_status()
         return self.client.patch(
             f"addon_runs/{self.id}/", json={"file_name": file_name}
@@ -189,7 +184,7 @@ class AddOn(BaseAddOn):
 
         response = self.client.get(f"addon_events/{self.event_id}/")
         response.raise_for_status()
-        return response.json()["scratch"]
+        return json_loads(response.content)["scratch"]
 
     def store_event_data(self, scratch):
         """Store persistent data for this event"""
@@ -3,7 +3,7 @@ from listcrunch.listcrunch import uncrunch
 
 # Local
 from .base import BaseAPIObject, ChildAPIClient
-from .toolbox import merge_dicts
+from .toolbox import json_loads, merge_dicts
 
 
 class Annotation(BaseAPIObject):
@@ -99,5 +99,6 @@ class AnnotationClient(ChildAPIClient):
         }
         response = self.client.post(f"{self.api_path}/", json=data)
         return Annotation(
-            self.client, merge_dicts(response.json(), {"document": self.parent})
+            self.client,
+            merge_dicts(json_loads(response.content), {"document": self.parent}),
         )
@@ -1,12 +1,25 @@
 # Standard Library
 from copy import copy
+from datetime import datetime
 
 # Third Party
 from dateutil.parser import parse as dateparser
 
 # Local
 from .exceptions import DuplicateObjectError
-from .toolbox import get_id, merge_dicts
+from .toolbox import get_id, json_loads, merge_dicts
+
+
+def parse_date(value):
+    """Parse a timestamp from the API
+
+    The ISO 8601 timestamps the API returns are handled by the much faster
+    standard library parser, falling back to dateutil for anything else
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return dateparser(value)
 
 
 class APIResults(object):
@@ -21,7 +34,7 @@ class APIResults(object):
 
         self.resource = resource
         self.client = client
-        json = response.json()
+        json = json_loads(response.content)
 
         self.count = json.get("count")
         self.next_url = json["next"]
@@ -100,7 +113,17 @@ class BaseAPIClient(object):
             params = {}
         response = self.client.get(f"{self.api_path}/{get_id(id_)}/", params=params)
         # pylint: disable=not-callable
-        return self.resource(self.client, response.json())
+        return self.resource(self.client, json_loads(response.content))
+
+    def exists(self, id_):
+        """Check if a resource exists without fetching it"""
+        response = self.client.head(
+            f"{self.api_path}/{get_id(id_)}/", raise_error=False
+        )
+        if response.status_code == 404:
+            return False
+        self.client.raise_for_status(response)
+        return True
 
     def delete(self, id_):
         """Deletes a resource"""
@@ -145,7 +168,7 @@ class BaseAPIObject(object):
         self.__dict__ = dict_
         self._client = client
         for field in self.date_fields:
-            setattr(self, field, dateparser(getattr(self, field)))
+            setattr(self, field, parse_date(getattr(self, field)))
 
     def __repr__(self):
         return f"<{self.__class__.__name__}: {self.id} - {self}>"  # pragma: no cover
@@ -17,7 +17,7 @@ from .documents import DocumentClient
 from .exceptions import APIError, CredentialsFailedError, DoesNotExistError
 from .organizations import OrganizationClient
 from .projects import ProjectClient
-from .toolbox import requests_retry_session
+from .toolbox import json_dumps, json_loads, requests_retry_session
 from .users import UserClient
 
 logger = logging.getLogger("documentcloud")
@@ -46,7 +46,13 @@ class DocumentCloud(object):
         self._user_id = None
         self.timeout = timeout
         self.refresh_token = None
-        self.session = requests.Session()
+        # mount the retrying adapter once, so its connection pool is kept across
+        # requests
+        self.session = requests_retry_session()
+        # unauthenticated session for requests made directly to storage, such as
+        # presigned uploads and asset downloads, kept around so that connections
+        # are reused across requests
+        self.storage_session = requests_retry_session()
         self._set_tokens()
 
         if loglevel:  # pragma: no cover
@@ -96,7 +102,7 @@ class DocumentCloud(object):
 
         self.raise_for_status(response)
 
-        json = response.json()
+        json = json_loads(response.content)
         return (json["access"], json["refresh"])
 
     def _refresh_tokens(self, refresh_token):
@@ -113,9 +119,19 @@ class DocumentCloud(object):
 
         self.raise_for_status(response)
 
-        json = response.json()
+        json = json_loads(response.content)
         return (json["access"], json["refresh"])
 
+    @property
+    def base_uri(self):
+        return self._base_uri
+
+    @base_uri.setter
+    def base_uri(self, value):
+        # the host is compared against every asset URL fetched, so parse it once
+        self._base_uri = value
+        self.base_netloc = urlparse(value).netloc
+
     @property
     def user_id(self):
         if self._user_id is None:
@@ -139,15 +155,23 @@ class DocumentCloud(object):
             # check to avoid double setting version
             kwargs.setdefault("params", {}).update({"version": "2.0"})
 
-        response = requests_retry_session(session=self.session).request(
-            method, url, timeout=self.timeout, **kwargs
-        )
+        if kwargs.get("json") is not None:
+            # serialize JSON bodies ourselves so that orjson is used when available
+            kwargs["data"] = json_dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                "Content-Type": "application/json",
+                **kwargs.get("headers", {}),
+            }
+
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
         logger.debug("response: %s - %s", response.status_code, response.content)
         if response.status_code == requests.codes.FORBIDDEN and set_tokens:
             self._set_tokens()
             # track set_tokens to not enter an infinite loop
             kwargs["set_tokens"] = False
-            return self._request(method, url, full_url=True, **kwargs)
+            return self._request(
+                method, url, raise_error=raise_error, full_url=True, **kwargs
+            )
 
         if raise_error:
             self.raise_for_status(response)
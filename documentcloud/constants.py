@@ -1,101 +1,100 @@
 PER_PAGE_MAX = 100
 BULK_LIMIT = 25
+UPLOAD_WORKERS = 8
 BASE_URI = "https://api.www.documentcloud.org/api/"
 AUTH_URI = "https://accounts.muckrock.com/api/"
 TIMEOUT = 20
 RATE_LIMIT = 10
 RATE_PERIOD = 1
-SUPPORTED_EXTENSIONS = [
-    ".abw",
-    ".zabw",
-    ".md",
-    ".pm3",
-    ".pm4",
-    ".pm5",
-    ".pm6",
-    ".p65",
-    ".cwk",
-    ".agd",
-    ".fhd",
-    ".kth",
-    ".key",
-    ".numbers",
-    ".pages",
-    ".bmp",
-    ".csv",
-    ".txt",
-    ".cdr",
-    ".cmx",
-    ".cgm",
-    ".dif",
-    ".dbf",
-    ".xml",
-    ".eps",
-    ".emf",
-    ".fb2",
-    ".gnm",
-    ".gnumeric",
-    ".gif",
-    ".hwp",
-    ".plt",
-    ".html",
-    ".htm",
-    ".jtd",
-    ".jtt",
-    ".jpg",
-    ".jpeg",
-    ".wk1",
-    ".wks",
-    ".123",
-    ".wk3",
-    ".wk4",
-    ".pct",
-    ".mml",
-    ".xls",
-    ".xlw",
-    ".xlt",
-    ".xlsx",
-    ".docx",
-    ".pptx",
-    ".ppt",
-    ".pps",
-    ".pot",
-    ".pptx",
-    ".pub",
-    ".rtf",
-    ".xml",
-    ".doc",
-    ".dot",
-    ".docx",
-    ".wps",
-    ".wks",
-    ".wdb",
-    ".wri",
-    ".vsd",
-    ".pgm",
-    ".pbm",
-    ".ppm",
-    ".odt",
-    ".fodt",
-    ".ods",
-    ".fods",
-    ".odp",
-    ".fodp",
-    ".odg",
-    ".fodg",
-    ".odf",
-    ".odb",
-    ".sxw",
-    ".stw",
-    ".sxc",
-    ".stc",
-    ".sxi",
-    ".sti",
-    ".sxd",
-    ".std",
-    ".sxm",
-    ".pcx",
-    ".pcd",
-    ".psd",
-    ".pdf",
-]
+SUPPORTED_EXTENSIONS = frozenset(
+    [
+        ".abw",
+        ".zabw",
+        ".md",
+        ".pm3",
+        ".pm4",
+        ".pm5",
+        ".pm6",
+        ".p65",
+        ".cwk",
+        ".agd",
+        ".fhd",
+        ".kth",
+        ".key",
+        ".numbers",
+        ".pages",
+        ".bmp",
+        ".csv",
+        ".txt",
+        ".cdr",
+        ".cmx",
+        ".cgm",
+        ".dif",
+        ".dbf",
+        ".xml",
+        ".eps",
+        ".emf",
+        ".fb2",
+        ".gnm",
+        ".gnumeric",
+        ".gif",
+        ".hwp",
+        ".plt",
+        ".html",
+        ".htm",
+        ".jtd",
+        ".jtt",
+        ".jpg",
+        ".jpeg",
+        ".wk1",
+        ".wks",
+        ".123",
+        ".wk3",
+        ".wk4",
+        ".pct",
+        ".mml",
+        ".xls",
+        ".xlw",
+        ".xlt",
+        ".xlsx",
+        ".docx",
+        ".pptx",
+        ".ppt",
+        ".pps",
+        ".pot",
+        ".pub",
+        ".rtf",
+        ".doc",
+        ".dot",
+        ".wps",
+        ".wdb",
+        ".wri",
+        ".vsd",
+        ".pgm",
+        ".pbm",
+        ".ppm",
+        ".odt",
+        ".fodt",
+        ".ods",
+        ".fods",
+        ".odp",
+        ".fodp",
+        ".odg",
+        ".fodg",
+        ".odf",
+        ".odb",
+        ".sxw",
+        ".stw",
+        ".sxc",
+        ".stc",
+        ".sxi",
+        ".sti",
+        ".sxd",
+        ".std",
+        ".sxm",
+        ".pcx",
+        ".pcd",
+        ".psd",
+        ".pdf",
+    ]
+)
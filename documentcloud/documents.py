@@ -8,7 +8,9 @@ import logging
 import os
 import re
 import warnings
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from urllib.parse import urlparse
 
 # Third Party
 from requests.exceptions import RequestException
@@ -16,22 +18,43 @@ from requests.exceptions import RequestException
 # Local
 from .annotations import AnnotationClient
 from .base import APIResults, BaseAPIClient, BaseAPIObject
-from .constants import BULK_LIMIT, SUPPORTED_EXTENSIONS
+from .constants import BULK_LIMIT, SUPPORTED_EXTENSIONS, UPLOAD_WORKERS
 from .exceptions import APIError
 from .organizations import Organization
 from .sections import SectionClient
-from .toolbox import grouper, is_url, merge_dicts, requests_retry_session
+from .toolbox import grouper, is_url, json_loads, merge_dicts
 from .users import User
 
-try:
-    from urllib.parse import urlparse
-except ImportError:
-    from urlparse import urlparse
-
 logger = logging.getLogger("documentcloud")
 
 IMAGE_SIZES = ["thumbnail", "small", "normal", "large", "xlarge"]
 
+IMAGE_ATTR_RE = re.compile(
+    r"^get_(?P<size>thumbnail|small|normal|large)_image_url(?P<list>_list)?$"
+)
+
+
+# cached since the generated names only depend on the class, while completion
+# tools may call dir() repeatedly
+@lru_cache(maxsize=None)
+def _class_dir(cls):
+    """All defined and generated attribute names for a document class"""
+    attrs = dir(cls)
+    getters = [a for a in attrs if a.startswith("get_")]
+    attrs += [a[len("get_") :] for a in getters]
+    attrs += [a[: -len("_url")] for a in getters if a.endswith("url")]
+    attrs += [a[len("get_") : -len("_url")] for a in getters if a.endswith("url")]
+    for size in IMAGE_SIZES:
+        attrs += [
+            f"get_{size}_image_url",
+            f"{size}_image_url",
+            f"get_{size}_image",
+            f"{size}_image",
+            f"get_{size}_image_url_list",
+            f"{size}_image_url_list",
+        ]
+    return frozenset(attrs)
+
 
 class Document(BaseAPIObject):
     """A single DocumentCloud document"""
@@ -73,9 +96,12 @@ class Document(BaseAPIObject):
 
     def __getattr__(self, attr):
         """Generate methods for fetching resources"""
-        p_image = re.compile(
-            r"^get_(?P<size>thumbnail|small|normal|large)_image_url(?P<list>_list)?$"
-        )
+        # none of the generated methods are private, so skip the lookups below
+        # for special or private names, such as those probed by copy and pickle
+        if attr.startswith("_"):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{attr}'"
+            )
         get = attr.startswith("get_")
         url = attr.endswith("_url")
         text = attr.endswith("_text")
@@ -83,16 +109,16 @@ class Document(BaseAPIObject):
         fmt = "json" if json else "text" if text else None
         # this allows dropping `get_` to act like a property, ie
         # .full_text_url
-        if not get and hasattr(self, f"get_{attr}"):
+        if not get and self._has_getter(f"get_{attr}"):
             return getattr(self, f"get_{attr}")()
         # this allows dropping `_url` to fetch the url, ie
         # .get_full_text()
-        if not url and hasattr(self, f"{attr}_url"):
+        if not url and self._has_getter(f"{attr}_url"):
             return lambda *a, **k: self._get_url(
                 getattr(self, f"{attr}_url")(*a, **k), fmt
             )
         # this genericizes the image sizes
-        m_image = p_image.match(attr)
+        m_image = IMAGE_ATTR_RE.match(attr)
         if m_image and m_image.group("list"):
             return partial(self.get_image_url_list, size=m_image.group("size"))
         if m_image and not m_image.group("list"):
@@ -101,22 +127,24 @@ class Document(BaseAPIObject):
             f"'{self.__class__.__name__}' object has no attribute '{attr}'"
         )
 
+    @classmethod
+    def _has_getter(cls, name):
+        """Check if `name` is a defined or generated getter
+
+        This only looks at the class, so it avoids the recursive `__getattr__`
+        calls that `hasattr` on the instance would make
+        """
+        if hasattr(cls, name) or IMAGE_ATTR_RE.match(name):
+            return True
+        # `get_<resource>` is generated from `get_<resource>_url`
+        return (
+            name.startswith("get_")
+            and not name.endswith("_url")
+            and cls._has_getter(f"{name}_url")
+        )
+
     def __dir__(self):
-        attrs = dir(type(self)) + list(self.__dict__.keys())
-        getters = [a for a in attrs if a.startswith("get_")]
-        attrs += [a[len("get_") :] for a in getters]
-        attrs += [a[: -len("_url")] for a in getters if a.endswith("url")]
-        attrs += [a[len("get_") : -len("_url")] for a in getters if a.endswith("url")]
-        for size in IMAGE_SIZES:
-            attrs += [
-                f"get_{size}_image_url",
-                f"{size}_image_url",
-                f"get_{size}_image",
-                f"{size}_image",
-                f"get_{size}_image_url_list",
-                f"{size}_image_url_list",
-            ]
-        return sorted(attrs)
+        return sorted(_class_dir(type(self)).union(self.__dict__))
 
     @property
     def pages(self):
@@ -124,14 +152,15 @@ class Document(BaseAPIObject):
 
     @property
     def mentions(self):
-        if hasattr(self, "highlights") and self.highlights is not None:
-            return [
-                Mention(page, text)
-                for page, texts in self.highlights.items()
-                for text in texts
-            ]
-        else:
-            return []
+        return list(self.iter_mentions())
+
+    def iter_mentions(self):
+        """Lazily generate the mentions from a search"""
+        highlights = getattr(self, "highlights", None)
+        if highlights is not None:
+            for page, texts in highlights.items():
+                for text in texts:
+                    yield Mention(page, text)
 
     @property
     def user(self):
@@ -160,22 +189,20 @@ class Document(BaseAPIObject):
         return self.organization.slug
 
     def _get_url(self, url, fmt=None):
-        base_netloc = urlparse(self._client.base_uri).netloc
-        url_netloc = urlparse(url).netloc
-
-        if base_netloc == url_netloc:
+        if self._client.base_netloc == urlparse(url).netloc:
             # if the url host is the same as the base api host,
             # sent the request with the client in order to include
             # authentication credentials
             response = self._client.get(url, full_url=True)
         else:
-            response = requests_retry_session().get(
+            response = self._client.storage_session.get(
                 url, headers={"User-Agent": "python-documentcloud2"}
             )
         if fmt == "text":
             return response.content.decode("utf8")
         elif fmt == "json":
-            return response.json()
+            # parse the bytes directly instead of decoding them to a string first
+            return json_loads(response.content)
         else:
             return response.content
 
@@ -215,7 +242,7 @@ class Document(BaseAPIObject):
 
         while endpoint:
             response = self._client.get(endpoint)
-            data = response.json()
+            data = json_loads(response.content)
 
             results = data.get("results", [])
             for entry in results:
@@ -257,15 +284,21 @@ class DocumentClient(BaseAPIClient):
 
         if query:
             params["q"] = query
+        self._join_list_params(params, ["expand"])
         response = self.client.get("documents/search/", params=params)
         return APIResults(self.resource, self.client, response)
 
     def list(self, **params):
-        """Convert id__in from list to string if needed"""
-        if "id__in" in params and isinstance(params["id__in"], list):
-            params["id__in"] = ",".join(str(i) for i in params["id__in"])
+        """Convert id__in and expand from list to string if needed"""
+        self._join_list_params(params, ["id__in", "expand"])
         return super().list(**params)
 
+    def _join_list_params(self, params, names):
+        """Convert list parameters to the comma separated strings the API expects"""
+        for name in names:
+            if name in params and isinstance(params[name], list):
+                params[name] = ",".join(str(i) for i in params[name])
+
     def upload(self, pdf, **kwargs):
         """Upload a document"""
 
@@ -284,18 +317,21 @@ class DocumentClient(BaseAPIClient):
         # otherwise use the direct file upload flow - determine if they passed
         # in a file or a path
         elif hasattr(pdf, "read"):
-            try:
-                size = os.fstat(pdf.fileno()).st_size
-            except (AttributeError, OSError):  # pragma: no cover
-                size = 0
-            check_size(size)
+            check_size(self._file_size(pdf))
             return self._upload_file(pdf, **kwargs)
         else:
-            size = os.path.getsize(pdf)
-            check_size(size)
+            # size the opened file instead of separately stat-ing the path
             with open(pdf, "rb") as pdf_file:
+                check_size(self._file_size(pdf_file))
                 return self._upload_file(pdf_file, **kwargs)
 
+    def _file_size(self, file_):
+        """Get the size of an open file, or 0 if it can not be determined"""
+        try:
+            return os.fstat(file_.fileno()).st_size
+        except (AttributeError, OSError):  # pragma: no cover
+            return 0
+
     def _format_upload_parameters(self, name, **kwargs):
         """Prepare upload parameters from kwargs"""
         allowed_parameters = [
@@ -313,9 +349,6 @@ class DocumentClient(BaseAPIClient):
             "projects",
             "delayed_index",
         ]
-        # these parameters currently do not work, investigate...
-        ignored_parameters = ["secure"]
-
         # title is required, so set a default
         params = {"title": self._get_title(name)}
 
@@ -326,9 +359,17 @@ class DocumentClient(BaseAPIClient):
             if param in kwargs:
                 params[param] = kwargs[param]
 
-        for param in ignored_parameters:
-            if param in kwargs:
-                warnings.warn(f"The parameter `{param}` is not currently supported")
+        # unknown parameters, as well as ones which currently do not work, such as
+        # `secure`, are dropped - collect them for a single warning
+        unsupported = [
+            f"`{param}`"
+            for param in kwargs
+            if param not in allowed_parameters and param != "project"
+        ]
+        if unsupported:
+            warnings.warn(
+                f"Unsupported parameters were ignored: {', '.join(unsupported)}"
+            )
 
         return params
 
@@ -341,7 +382,7 @@ class DocumentClient(BaseAPIClient):
         params = self._format_upload_parameters(file_url, **kwargs)
         params["file_url"] = file_url
         response = self.client.post("documents/", json=params)
-        return Document(self.client, response.json())
+        return Document(self.client, json_loads(response.content))
 
     def _upload_file(self, file_, **kwargs):
         """Upload a document directly"""
@@ -351,9 +392,10 @@ class DocumentClient(BaseAPIClient):
         response = self.client.post("documents/", json=params)
 
         # upload the file directly to storage
-        create_json = response.json()
+        create_json = json_loads(response.content)
         presigned_url = create_json["presigned_url"]
-        response = requests_retry_session().put(presigned_url, data=file_.read())
+        response = self.client.storage_session.put(presigned_url, data=file_)
+        self.client.raise_for_status(response)
 
         # begin processing the document
         doc_id = create_json["id"]
@@ -365,16 +407,50 @@ class DocumentClient(BaseAPIClient):
 
     def _collect_files(self, path, extensions):
         """Find the paths to files with specified extensions under a directory"""
-        path_list = []
-        for dirpath, _, filenames in os.walk(path):
-            path_list.extend(
-                [
-                    os.path.join(dirpath, filename)
-                    for filename in filenames
-                    if os.path.splitext(filename)[1].lower() in extensions
-                ]
-            )
-        return path_list
+        for dirpath, dirnames, filenames in os.walk(path):
+            # walk in sorted order so files are uploaded in a predictable order
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if os.path.splitext(filename)[1].lower() in extensions:
+                    yield os.path.join(dirpath, filename)
+
+    def _put_file(self, url, file_path):
+        """Upload a single file directly to storage"""
+        logger.info("Uploading %s to S3...", file_path)
+        # pass the file object so requests streams it instead of reading it
+        # into memory
+        with open(file_path, "rb") as file:
+            response = self.client.storage_session.put(url, data=file)
+        self.client.raise_for_status(response)
+
+    def _put_files(self, create_json, file_paths, handle_errors):
+        """Upload a group of files to storage, returning the IDs of those uploaded"""
+        # The uploads are independent of each other, so run them concurrently
+        doc_ids = []
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            uploads = [
+                (
+                    j["id"],
+                    file_path,
+                    executor.submit(self._put_file, j["presigned_url"], file_path),
+                )
+                for j, file_path in zip(create_json, file_paths)
+            ]
+            for doc_id, file_path, future in uploads:
+                try:
+                    future.result()
+                except (APIError, RequestException) as exc:
+                    if handle_errors:
+                        logger.info(
+                            "Error uploading the following document: %s %s",
+                            exc,
+                            file_path,
+                        )
+                        continue
+                    else:
+                        raise
+                doc_ids.append(doc_id)
+        return doc_ids
 
     def upload_directory(self, path, handle_errors=False, extensions=".pdf", **kwargs):
         """Upload files with specified extensions in a directory"""
@@ -389,18 +465,21 @@ class DocumentClient(BaseAPIClient):
             extensions = SUPPORTED_EXTENSIONS
 
         # Convert single extension to a list if provided
-        if extensions and not isinstance(extensions, list):
+        if extensions and not isinstance(extensions, (list, set, frozenset)):
             extensions = [extensions]
 
+        # Use a set so each file's extension is checked with a single lookup
+        extensions = frozenset(extensions)
+
         # Checks to see if the extensions are supported, raises an error if not.
-        invalid_extensions = set(extensions) - set(SUPPORTED_EXTENSIONS)
+        invalid_extensions = extensions - SUPPORTED_EXTENSIONS
         if invalid_extensions:
             raise ValueError(
-                f"Invalid extensions provided: {', '.join(invalid_extensions)}"
+                f"Invalid extensions provided: {', '.join(sorted(invalid_extensions))}"
             )
 
         # Loop through the path and get all the files with matching extensions
-        path_list = self._collect_files(path, extensions)
+        path_list = list(self._collect_files(path, extensions))
 
         logger.info(
             "Upload directory on %s: Found %d files to upload",
@@ -450,29 +529,16 @@ class DocumentClient(BaseAPIClient):
                     raise
 
             # Upload the files directly to storage
-            create_json = response.json()
+            create_json = json_loads(response.content)
             obj_list.extend(create_json)
-            presigned_urls = [j["presigned_url"] for j in create_json]
-            for url, file_path in zip(presigned_urls, file_paths):
-                logger.info("Uploading %s to S3...", file_path)
-                try:
-                    with open(file_path, "rb") as file:
-                        response = requests_retry_session().put(url, data=file.read())
-                    self.client.raise_for_status(response)
-                except (APIError, RequestException) as exc:
-                    if handle_errors:
-                        logger.info(
-                            "Error uploading the following document: %s %s",
-                            exc,
-                            file_path
-                        )
-                        continue
-                    else:
-                        raise
+            doc_ids = self._put_files(create_json, file_paths, handle_errors)
+
+            # Documents without a file can not be processed
+            if not doc_ids:
+                continue
 
             # Begin processing the documents
             logger.info("Processing the documents...")
-            doc_ids = [j["id"] for j in create_json]
             try:
                 response = self.client.post("documents/process/", json={"ids": doc_ids})
             except (APIError, RequestException) as exc:
@@ -536,7 +602,7 @@ class DocumentClient(BaseAPIClient):
                 else:
                     raise
 
-            create_json = response.json()
+            create_json = json_loads(response.content)
             obj_list.extend(create_json)
 
         logger.info("Upload URLs complete")
@@ -548,6 +614,9 @@ class DocumentClient(BaseAPIClient):
 class Mention:
     """A snippet from a document search"""
 
+    # searches can return many mentions, so keep them small
+    __slots__ = ("page", "text")
+
     def __init__(self, page, text):
         if page.startswith("page_no_"):
             page = page[len("page_no_") :]
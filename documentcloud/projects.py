@@ -3,7 +3,7 @@ from .base import APISet, BaseAPIClient, BaseAPIObject
 from .constants import BULK_LIMIT, PER_PAGE_MAX
 from .documents import Document
 from .exceptions import DoesNotExistError, MultipleObjectsReturnedError
-from .toolbox import get_id, grouper
+from .toolbox import get_id, grouper, json_loads
 
 
 class Project(BaseAPIObject):
@@ -35,12 +35,12 @@ class Project(BaseAPIObject):
                 f"{self.api_path}/{get_id(self.id)}/documents/",
                 params={"per_page": self._per_page, "expand": ["document"]},
             )
-            json = response.json()
+            json = json_loads(response.content)
             next_url = json["next"]
             results = json["results"]
             while next_url:
                 response = self._client.get(next_url, full_url=True)
-                json = response.json()
+                json = json_loads(response.content)
                 next_url = json["next"]
                 results.extend(json["results"])
             self._document_list = APISet(
@@ -74,7 +74,7 @@ class Project(BaseAPIObject):
             f"{self.api_path}/{get_id(self.id)}/documents/{doc_id}",
             params={"expand": ["document"]},
         )
-        return Document(self._client, response.json()["document"])
+        return Document(self._client, json_loads(response.content)["document"])
 
     def clear_documents(self):
         """Remove all documents from this project"""
@@ -121,7 +121,7 @@ class ProjectClient(BaseAPIClient):
         response = self.client.get(
             f"{self.api_path}/", params={"title": title, "user": self.client.user_id}
         )
-        json = response.json()
+        json = json_loads(response.content)
         count = len(json["results"])
         if count == 0:
             raise DoesNotExistError(response=response)
@@ -133,7 +133,7 @@ class ProjectClient(BaseAPIClient):
     def create(self, title, description="", private=True, document_ids=None):
         data = {"title": title, "description": description, "private": private}
         response = self.client.post(self.api_path + "/", json=data)
-        project = Project(self.client, response.json())
+        project = Project(self.client, json_loads(response.content))
         if document_ids:
             data = [{"document": d} for d in document_ids]
             response = self.client.put(
@@ -1,6 +1,6 @@
 # Local
 from .base import BaseAPIObject, ChildAPIClient
-from .toolbox import merge_dicts
+from .toolbox import json_loads, merge_dicts
 
 
 class Section(BaseAPIObject):
@@ -33,5 +33,6 @@ class SectionClient(ChildAPIClient):
         data = {"title": title, "page_number": page_number}
         response = self.client.post(f"{self.api_path}/", json=data)
         return Section(
-            self.client, merge_dicts(response.json(), {"document": self.parent})
+            self.client,
+            merge_dicts(json_loads(response.content), {"document": self.parent}),
         )
@@ -3,6 +3,8 @@ A few toys the API will use.
 """
 
 # Standard Library
+import datetime
+import json
 from itertools import zip_longest
 from urllib.parse import urlparse
 
@@ -11,6 +13,12 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    # Third Party
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 def requests_retry_session(
     retries=3, backoff_factor=0.3, status_forcelist=(500, 502, 504), session=None
@@ -73,3 +81,32 @@ def merge_dicts(*dicts):
     for dict_ in dicts:
         merged.update(dict_)
     return merged
+
+
+def json_loads(data):
+    """Parse JSON from a string or bytes, using orjson if it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize to UTF-8 encoded JSON, using orjson if it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    # match orjson's compact, non-ASCII escaping output
+    data = json.dumps(
+        obj,
+        allow_nan=False,
+        default=_json_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return data.encode("utf-8")
+
+
+def _json_default(obj):
+    """Serialize dates and times as ISO 8601 strings, as orjson does"""
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
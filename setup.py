@@ -18,7 +18,6 @@ setup(
     packages=("documentcloud",),
     include_package_data=True,
     install_requires=(
-        "future",
         "listcrunch>=1.0.1",
         "python-dateutil",
         "ratelimit",
@@ -36,10 +35,12 @@ setup(
             "sphinx",
             "twine",
         ],
+        "orjson": ["orjson"],
         "test": [
             "pytest",
             "pytest-mock",
             "pytest-recording",
+            "pytest-testmon",
             "vcrpy",
         ],
     },
@@ -2,11 +2,13 @@
 from __future__ import division, print_function, unicode_literals
 
 # Standard Library
+import json
 import time
 from uuid import uuid4
 
 # Third Party
 import pytest
+import requests
 import vcr
 
 # DocumentCloud
@@ -21,7 +23,17 @@ PASSWORD = "test-password"
 TIMEOUT = 2.0
 DEFAULT_DOCUMENT_URI = "https://assets.documentcloud.org/documents/20071460/test.pdf"
 
-# pylint: disable=redefined-outer-name
+# Keep access tokens out of newly recorded cassettes.  This is used both for the
+# tests, through pytest-recording, and for the cassettes the fixtures record
+VCR_CONFIG = {"filter_headers": ["authorization"]}
+fixture_vcr = vcr.VCR(**VCR_CONFIG)
+
+# pylint: disable=redefined-outer-name, protected-access
+
+
+@pytest.fixture(scope="session")
+def vcr_config():
+    return VCR_CONFIG
 
 
 # We want to enable VCR for all tests
@@ -35,7 +47,7 @@ def pytest_collection_modifyitems(items):
 
 
 @pytest.fixture(scope="session")
-@vcr.use_cassette("tests/cassettes/fixtures/client.yaml")
+@fixture_vcr.use_cassette("tests/cassettes/fixtures/client.yaml")
 def client():
     return DocumentCloud(
         username=USERNAME,
@@ -48,7 +60,7 @@ def client():
 
 
 @pytest.fixture(scope="session")
-@vcr.use_cassette("tests/cassettes/fixtures/rate_client.yaml")
+@fixture_vcr.use_cassette("tests/cassettes/fixtures/rate_client.yaml")
 def rate_client():
     """This client is solely to test rate limiting"""
     return DocumentCloud(
@@ -62,7 +74,7 @@ def rate_client():
 
 
 @pytest.fixture(scope="session")
-@vcr.use_cassette("tests/cassettes/short_fixtures/short_client.yaml")
+@fixture_vcr.use_cassette("tests/cassettes/short_fixtures/short_client.yaml")
 def short_client():
     """This client is to be used with the dev server set to issue tokens
     with very short expirations in order to test out the expired token
@@ -78,13 +90,26 @@ def short_client():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def public_client():
     return DocumentCloud(
         base_uri=BASE_URI, auth_uri=AUTH_URI, timeout=TIMEOUT, rate_limit=False
     )
 
 
+@pytest.fixture
+def make_response():
+    """Build fake API responses, for tests which mock out the HTTP requests"""
+
+    def make(status_code=200, json_=None):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = b"" if json_ is None else json.dumps(json_).encode()
+        return response
+
+    return make
+
+
 def _wait_document(document, client, record_mode):
     # wait for document to finish processing
     while document.status in ("nofile", "pending"):
@@ -97,7 +122,7 @@ def _wait_document(document, client, record_mode):
 
 @pytest.fixture(scope="session")
 def document(project, client, record_mode):
-    with vcr.use_cassette("tests/cassettes/fixtures/document.yaml"):
+    with fixture_vcr.use_cassette("tests/cassettes/fixtures/document.yaml"):
         document = client.documents.upload(
             DEFAULT_DOCUMENT_URI,
             access="private",
@@ -129,7 +154,7 @@ def document_factory(client, record_mode):
 
     yield make_document
 
-    with vcr.use_cassette("tests/cassettes/fixtures/document_factory.yaml"):
+    with fixture_vcr.use_cassette("tests/cassettes/fixtures/document_factory.yaml"):
         for document in documents:
             try:
                 document.delete()
@@ -140,7 +165,7 @@ def document_factory(client, record_mode):
 
 @pytest.fixture(scope="session")
 def project(client, document_factory):
-    with vcr.use_cassette("tests/cassettes/fixtures/project.yaml"):
+    with fixture_vcr.use_cassette("tests/cassettes/fixtures/project.yaml"):
         document = document_factory()
         title = f"This is a project for testing {uuid4()}"
         project = client.projects.create(
@@ -163,7 +188,7 @@ def project_factory(client):
 
     yield make_project
 
-    with vcr.use_cassette("tests/cassettes/fixtures/project_factory.yaml"):
+    with fixture_vcr.use_cassette("tests/cassettes/fixtures/project_factory.yaml"):
         for project in projects:
             try:
                 project.delete()
@@ -2,12 +2,13 @@
 from __future__ import division, print_function, unicode_literals
 
 # Standard Library
-from builtins import str
+from datetime import datetime, timezone
 
 # Third Party
 import pytest
 
 # DocumentCloud
+from documentcloud.base import parse_date
 from documentcloud.documents import Document
 from documentcloud.exceptions import DuplicateObjectError
 
@@ -112,3 +113,16 @@ class TestAPISet:
     def test_extend_dupe(self, project, document):
         with pytest.raises(DuplicateObjectError):
             project.document_list.extend([document])
+
+
+@pytest.mark.parametrize(
+    "value", ["2023-10-26T20:22:09.059748Z", "2023-10-26T20:22:09.059748+00:00"]
+)
+def test_parse_date(value):
+    assert parse_date(value) == datetime(
+        2023, 10, 26, 20, 22, 9, 59748, tzinfo=timezone.utc
+    )
+
+
+def test_parse_date_fallback():
+    assert parse_date("Oct 26 2023") == datetime(2023, 10, 26)
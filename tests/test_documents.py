@@ -2,7 +2,6 @@
 from __future__ import division, print_function, unicode_literals
 
 # Standard Library
-from builtins import str
 from datetime import datetime
 
 # Third Party
@@ -16,6 +15,46 @@ from documentcloud.users import User
 
 # pylint: disable=protected-access
 
+URL_ATTRS = (
+    "full_text_url",
+    "full_text",
+    "thumbnail_image_url",
+    "small_image",
+    "normal_image_url_list",
+    "large_image_url",
+    "page_text",
+    "json_text_url",
+    "pdf",
+)
+URL_METHODS = tuple(f"get_{attr}" for attr in URL_ATTRS)
+DOCUMENT_ATTRS = (
+    "id",
+    "access",
+    "asset_url",
+    "canonical_url",
+    "created_at",
+    "data",
+    "description",
+    "edit_access",
+    "language",
+    "organization_id",
+    "page_count",
+    "page_spec",
+    "projects",
+    "related_article",
+    "published_url",
+    "slug",
+    "source",
+    "status",
+    "title",
+    "updated_at",
+    "user_id",
+    "pages",
+    "contributor",
+    "contributor_organization",
+    "contributor_organization_slug",
+)
+
 
 class TestDocument:
     def test_str(self, document):
@@ -25,53 +64,26 @@ class TestDocument:
         for date_field in document.date_fields:
             assert isinstance(getattr(document, date_field), datetime)
 
-    @pytest.mark.parametrize(
-        "attr",
-        [
-            "full_text_url",
-            "full_text",
-            "thumbnail_image_url",
-            "small_image",
-            "normal_image_url_list",
-            "large_image_url",
-            "page_text",
-            "json_text_url",
-            "pdf",
-        ],
-    )
-    def test_getattr(self, document, attr):
-        assert getattr(document, attr)
-
-    @pytest.mark.parametrize(
-        "attr",
-        [
-            "get_full_text_url",
-            "get_full_text",
-            "get_thumbnail_image_url",
-            "get_small_image",
-            "get_normal_image_url_list",
-            "get_large_image_url",
-            "get_page_text",
-            "get_json_text_url",
-            "get_pdf",
-        ],
-    )
-    def test_getattr_method(self, document, attr):
-        assert getattr(document, attr)()
-
-    @pytest.mark.parametrize(
-        "attr",
-        [
-            "full_text_url",
-            "get_full_text",
-            "thumbnail_image_url",
-            "get_small_image",
-            "normal_image_url_list",
-            "get_large_image_url",
-        ],
-    )
-    def test_dir(self, document, attr):
-        assert attr in dir(document)
+    def test_getattr(self, document):
+        for attr in URL_ATTRS:
+            assert getattr(document, attr), attr
+
+    def test_getattr_method(self, document):
+        for attr in URL_METHODS:
+            assert getattr(document, attr)(), attr
+
+    def test_getattr_private(self, document, mocker):
+        # pylint: disable=pointless-statement
+        has_getter = mocker.spy(type(document), "_has_getter")
+        with pytest.raises(AttributeError):
+            document._missing
+        # private names are not looked up as generated getters
+        has_getter.assert_not_called()
+
+    def test_dir(self, document):
+        names = set(dir(document))
+        for attr in URL_ATTRS + URL_METHODS:
+            assert attr in names, attr
 
     def test_mentions(self, client, document):
         document = client.documents.search(
@@ -81,9 +93,13 @@ class TestDocument:
         mention = document.mentions[0]
         assert mention.page
         assert "<em>text</em>" in mention.text
+        assert [(m.page, m.text) for m in document.iter_mentions()] == [
+            (m.page, m.text) for m in document.mentions
+        ]
 
     def test_mentions_nosearch(self, document):
         assert not document.mentions
+        assert not list(document.iter_mentions())
 
     def test_user(self, document):
         assert document._user is None
@@ -100,38 +116,9 @@ class TestDocument:
         assert isinstance(document.organization, Organization)
         assert document.organization == document._organization
 
-    @pytest.mark.parametrize(
-        "attr",
-        [
-            "id",
-            "access",
-            "asset_url",
-            "canonical_url",
-            "created_at",
-            "data",
-            "description",
-            "edit_access",
-            "language",
-            "organization_id",
-            "page_count",
-            "page_spec",
-            "projects",
-            "related_article",
-            "published_url",
-            "slug",
-            "source",
-            "status",
-            "title",
-            "updated_at",
-            "user_id",
-            "pages",
-            "contributor",
-            "contributor_organization",
-            "contributor_organization_slug",
-        ],
-    )
-    def test_attrs(self, document, attr):
-        assert getattr(document, attr)
+    def test_attrs(self, document):
+        for attr in DOCUMENT_ATTRS:
+            assert getattr(document, attr), attr
 
     def test_save(self, client, document):
         assert document.source == "DocumentCloud"
@@ -169,6 +156,15 @@ class TestDocumentClient:
         my_documents = client.documents.list(user=client.user_id)
         assert len(list(all_documents)) > len(list(my_documents.results))
 
+    @pytest.mark.parametrize("method, args", [("list", ()), ("search", ("simple",))])
+    def test_expand(self, client, mocker, make_response, method, args):
+        response = make_response(
+            json_={"count": 0, "next": None, "previous": None, "results": []}
+        )
+        get = mocker.patch.object(client, "get", return_value=response)
+        getattr(client.documents, method)(*args, expand=["user", "organization"])
+        assert get.call_args[1]["params"]["expand"] == "user,organization"
+
     def test_upload_url(self, document_factory):
         document = document_factory()
         assert document.status == "success"
@@ -187,20 +183,92 @@ class TestDocumentClient:
         document = document_factory("tests/test.pdf")
         assert document.status == "success"
 
-    def test_upload_big_file(self, client, mocker):
-        mocker.patch("os.path.getsize", return_value=502 * 1024 * 1024)
+    def test_upload_big_file(self, client, monkeypatch):
+        monkeypatch.setattr(
+            client.documents, "_file_size", lambda file_: 502 * 1024 * 1024
+        )
         with pytest.raises(ValueError):
             client.documents.upload("tests/test.pdf")
 
+    def test_upload_file_storage_error(self, client, mocker, make_response):
+        post = mocker.patch.object(
+            client,
+            "post",
+            return_value=make_response(
+                201,
+                {
+                    "id": 1,
+                    "presigned_url": "https://storage/1",
+                    "created_at": "2023-10-26T20:22:09.059748Z",
+                    "updated_at": "2023-10-26T20:22:09.059748Z",
+                },
+            ),
+        )
+        mocker.patch.object(
+            client.storage_session, "put", return_value=make_response(403)
+        )
+        with pytest.raises(APIError):
+            client.documents.upload("tests/test.pdf")
+        # the document is not processed without its file
+        assert post.call_count == 1
+
     def test_upload_dir(self, client):
         documents = client.documents.upload_directory("tests/pdfs/")
         assert len(documents) == 2
 
+    @staticmethod
+    def _mock_upload_dir(client, mocker, make_response, failed_paths):
+        """Mock the API calls for uploading tests/pdfs/, failing the uploads to
+        storage for the given paths"""
+        response = make_response(
+            201,
+            [
+                {
+                    "id": id_,
+                    "presigned_url": f"https://storage/{id_}",
+                    "created_at": "2023-10-26T20:22:09.059748Z",
+                    "updated_at": "2023-10-26T20:22:09.059748Z",
+                }
+                for id_ in (1, 2)
+            ],
+        )
+        post = mocker.patch.object(client, "post", return_value=response)
+
+        def put_file(_url, file_path):
+            if file_path in failed_paths:
+                raise APIError("upload failed")
+
+        mocker.patch.object(client.documents, "_put_file", side_effect=put_file)
+        return post
+
+    def test_upload_dir_upload_error(self, client, mocker, make_response):
+        post = self._mock_upload_dir(
+            client, mocker, make_response, ["tests/pdfs/test.pdf"]
+        )
+        client.documents.upload_directory("tests/pdfs/", handle_errors=True)
+        post.assert_called_with("documents/process/", json={"ids": [2]})
+
+    def test_upload_dir_upload_error_all(self, client, mocker, make_response):
+        post = self._mock_upload_dir(
+            client,
+            mocker,
+            make_response,
+            ["tests/pdfs/test.pdf", "tests/pdfs/text.pdf"],
+        )
+        client.documents.upload_directory("tests/pdfs/", handle_errors=True)
+        assert post.call_count == 1
+        assert post.call_args[0] == ("documents/",)
+
     def test_format_upload_parameters(self, client):
-        with pytest.warns(UserWarning):
+        with pytest.warns(UserWarning) as record:
             params = client.documents._format_upload_parameters(
                 "tests/test.pdf", access="private", secure=True, project=2, foo="bar"
             )
+        assert len(record) == 1
+        assert (
+            str(record[0].message)
+            == "Unsupported parameters were ignored: `secure`, `foo`"
+        )
         assert params == {"title": "test", "access": "private", "projects": [2]}
 
     def test_delete(self, document_factory, client):
@@ -210,6 +278,28 @@ class TestDocumentClient:
         with pytest.raises(DoesNotExistError):
             client.documents.get(document.id)
 
+    @pytest.mark.parametrize("status_code, exists", [(200, True), (404, False)])
+    def test_exists(self, client, monkeypatch, make_response, status_code, exists):
+        response = make_response(status_code)
+        monkeypatch.setattr(client, "head", lambda url, raise_error: response)
+        assert client.documents.exists(1) is exists
+
+    def test_exists_error(self, client, monkeypatch, make_response):
+        response = make_response(500)
+        monkeypatch.setattr(client, "head", lambda url, raise_error: response)
+        with pytest.raises(APIError):
+            client.documents.exists(1)
+
+    def test_exists_expired_token(self, client, mocker, make_response):
+        # the access token is refreshed after a 403 and the request is retried
+        mocker.patch.object(client, "_set_tokens")
+        mocker.patch.object(
+            client.session,
+            "request",
+            side_effect=[make_response(403), make_response(404)],
+        )
+        assert client.documents.exists(1) is False
+
 
 class TestMention:
     def test_mention(self):
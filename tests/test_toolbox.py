@@ -1,8 +1,24 @@
 # Future
 from __future__ import division, print_function, unicode_literals
 
+# Standard Library
+from datetime import date, datetime, timezone
+
+# Third Party
+import pytest
+
 # DocumentCloud
-from documentcloud.toolbox import get_id
+from documentcloud import toolbox
+from documentcloud.toolbox import get_id, json_dumps, json_loads
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson, and again with the standard library fallback"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(toolbox, "orjson", None)
 
 
 def test_get_id_number():
@@ -23,3 +39,47 @@ def test_get_id_postfix():
 
 def test_get_id_both():
     assert get_id("42-foo-bar-123") == "42"
+
+
+@pytest.mark.usefixtures("json_backend")
+def test_json_roundtrip():
+    obj = {"title": "Test", "data": {"_tag": ["document"]}, "projects": [1, 2]}
+    assert json_loads(json_dumps(obj)) == obj
+
+
+@pytest.mark.usefixtures("json_backend")
+def test_json_dumps_bytes():
+    assert isinstance(json_dumps({"title": "Tést"}), bytes)
+
+
+@pytest.mark.usefixtures("json_backend")
+def test_json_dumps_datetime():
+    publish_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert json_loads(json_dumps({"publish_at": publish_at})) == {
+        "publish_at": "2020-01-01T00:00:00+00:00"
+    }
+
+
+@pytest.mark.usefixtures("json_backend")
+def test_json_dumps_date():
+    assert json_dumps({"published": date(2020, 1, 1)}) == b'{"published":"2020-01-01"}'
+
+
+@pytest.mark.usefixtures("json_backend")
+def test_json_dumps_unserializable():
+    with pytest.raises(TypeError):
+        json_dumps({"document": object()})
+
+
+def test_json_fallback(monkeypatch):
+    pytest.importorskip("orjson")
+    obj = {"title": "Tést", "page_count": 2, 1: [1.5, None, True]}
+    data = json_dumps(obj)
+    monkeypatch.setattr(toolbox, "orjson", None)
+    assert json_dumps(obj) == data
+    # orjson and the fallback both turn the integer key into a string
+    assert json_loads(data) == {
+        "title": "Tést",
+        "page_count": 2,
+        "1": [1.5, None, True],
+    }